@@ -1,6 +1,7 @@
 package api
 
 import (
+	"bytes"
 	"encoding/csv"
 	"encoding/json"
 	"log"
@@ -108,6 +109,7 @@ func (h *Handler) handleMetadataColors(w http.ResponseWriter, r *http.Request) {
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -170,6 +172,7 @@ func (h *Handler) handleMetadataDetails(w http.ResponseWriter, r *http.Request)
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -232,6 +235,7 @@ func (h *Handler) handleMetadataVariableTypes(w http.ResponseWriter, r *http.Req
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -294,6 +298,7 @@ func (h *Handler) handleMetadataInputs(w http.ResponseWriter, r *http.Request) {
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -357,6 +362,7 @@ func (h *Handler) handleMetadataCanMap(w http.ResponseWriter, r *http.Request) {
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -420,6 +426,7 @@ func (h *Handler) handleMetadataCanGraph(w http.ResponseWriter, r *http.Request)
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -483,6 +490,7 @@ func (h *Handler) handleMetadataAxisLabels(w http.ResponseWriter, r *http.Reques
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -545,6 +553,7 @@ func (h *Handler) handleMetadataChartTypes(w http.ResponseWriter, r *http.Reques
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -607,6 +616,7 @@ func (h *Handler) handleMetadataGroupingValues(w http.ResponseWriter, r *http.Re
 
 	reader := csv.NewReader(file)
 	reader.TrimLeadingSpace = true
+	reader.ReuseRecord = true
 
 	headers, err := reader.Read()
 	if err != nil {
@@ -1024,13 +1034,14 @@ func (h *Handler) handleDissolveCatchments(w http.ResponseWriter, r *http.Reques
 		return
 	}
 
-	// Compute bounding box
+	// Compute bounding box from the catchments' spatial index envelopes,
+	// falling back to the dissolved geometry's vertices
 	var bbox *sites.BoundingBox
-	if len(geometry) > 0 {
-		var geom map[string]interface{}
-		if err := json.Unmarshal(geometry, &geom); err == nil {
-			bbox = &sites.BoundingBox{MinX: 180, MinY: 90, MaxX: -180, MaxY: -90}
-			extractBBoxFromGeom(geom, bbox)
+	if minX, minY, maxX, maxY, err := h.gpkgStore.GetCatchmentsBoundingBox(req.CatchmentIDs); err == nil {
+		bbox = &sites.BoundingBox{MinX: minX, MinY: minY, MaxX: maxX, MaxY: maxY}
+	} else if len(geometry) > 0 {
+		if computed, err := sites.ComputeBoundingBox(geometry); err == nil {
+			bbox = computed
 		}
 	}
 
@@ -1043,75 +1054,6 @@ func (h *Handler) handleDissolveCatchments(w http.ResponseWriter, r *http.Reques
 	respondJSON(w, http.StatusOK, response)
 }
 
-// extractBBoxFromGeom recursively extracts coordinates to compute bounding box
-func extractBBoxFromGeom(geom map[string]interface{}, bbox *sites.BoundingBox) {
-	geomType, _ := geom["type"].(string)
-
-	switch geomType {
-	case "Polygon", "MultiLineString":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok {
-			for _, ring := range coords {
-				r, ok := ring.([]interface{})
-				if ok {
-					for _, c := range r {
-						pt, ok := c.([]interface{})
-						if ok && len(pt) >= 2 {
-							x, _ := pt[0].(float64)
-							y, _ := pt[1].(float64)
-							if x < bbox.MinX {
-								bbox.MinX = x
-							}
-							if x > bbox.MaxX {
-								bbox.MaxX = x
-							}
-							if y < bbox.MinY {
-								bbox.MinY = y
-							}
-							if y > bbox.MaxY {
-								bbox.MaxY = y
-							}
-						}
-					}
-				}
-			}
-		}
-	case "MultiPolygon":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok {
-			for _, polygon := range coords {
-				p, ok := polygon.([]interface{})
-				if ok {
-					for _, ring := range p {
-						r, ok := ring.([]interface{})
-						if ok {
-							for _, c := range r {
-								pt, ok := c.([]interface{})
-								if ok && len(pt) >= 2 {
-									x, _ := pt[0].(float64)
-									y, _ := pt[1].(float64)
-									if x < bbox.MinX {
-										bbox.MinX = x
-									}
-									if x > bbox.MaxX {
-										bbox.MaxX = x
-									}
-									if y < bbox.MinY {
-										bbox.MinY = y
-									}
-									if y > bbox.MaxY {
-										bbox.MaxY = y
-									}
-								}
-							}
-						}
-					}
-				}
-			}
-		}
-	}
-}
-
 // handleCatchmentGeometry returns the full geometry for a single catchment from the GeoPackage
 func (h *Handler) handleCatchmentGeometry(w http.ResponseWriter, r *http.Request) {
 	if h.gpkgStore == nil {
@@ -1145,8 +1087,17 @@ func (h *Handler) handleCatchmentGeometry(w http.ResponseWriter, r *http.Request
 
 // ExtractIndicatorsRequest represents the request body for indicator extraction
 type ExtractIndicatorsRequest struct {
-	Runtime string                 `json:"runtime"`
-	Site    map[string]interface{} `json:"site"`
+	Runtime string          `json:"runtime"`
+	Site    json.RawMessage `json:"site"`
+}
+
+// isEmptyJSONValue reports whether a raw JSON value is absent, null or an empty object
+func isEmptyJSONValue(raw json.RawMessage) bool {
+	t := bytes.TrimSpace(raw)
+	if len(t) == 0 || bytes.Equal(t, []byte("null")) {
+		return true
+	}
+	return t[0] == '{' && t[len(t)-1] == '}' && len(bytes.TrimSpace(t[1:len(t)-1])) == 0
 }
 
 // handleExtractIndicators extracts and stores indicators for a site from its catchments
@@ -1174,21 +1125,14 @@ func (h *Handler) handleExtractIndicators(w http.ResponseWriter, r *http.Request
 	var err error
 
 	if req.Runtime == "browser" {
-		// Convert map to Site struct - never fetch from store in browser mode
-		if len(req.Site) == 0 {
+		// Decode site from the request body - never fetch from store in browser mode
+		if isEmptyJSONValue(req.Site) {
 			respondError(w, http.StatusBadRequest, "browser runtime requires site data in request body")
 			return
 		}
 
-		// Marshal and unmarshal to convert map to struct
-		siteJSON, marshalErr := json.Marshal(req.Site)
-		if marshalErr != nil {
-			respondError(w, http.StatusBadRequest, "invalid site data in request body")
-			return
-		}
-
 		site = &sites.Site{}
-		if err = json.Unmarshal(siteJSON, site); err != nil {
+		if err = json.Unmarshal(req.Site, site); err != nil {
 			respondError(w, http.StatusBadRequest, "invalid site data in request body")
 			return
 		}
@@ -1448,19 +1392,13 @@ func (h *Handler) handleSiteCatchments(w http.ResponseWriter, r *http.Request) {
 		}
 
 		if req.Runtime == "browser" {
-			if len(req.Site) == 0 {
+			if isEmptyJSONValue(req.Site) {
 				respondError(w, http.StatusBadRequest, "browser runtime requires site data in request body")
 				return
 			}
 
-			siteJSON, marshalErr := json.Marshal(req.Site)
-			if marshalErr != nil {
-				respondError(w, http.StatusBadRequest, "invalid site data in request body")
-				return
-			}
-
 			site = &sites.Site{}
-			if err = json.Unmarshal(siteJSON, site); err != nil {
+			if err = json.Unmarshal(req.Site, site); err != nil {
 				respondError(w, http.StatusBadRequest, "invalid site data in request body")
 				return
 			}
@@ -1636,10 +1574,8 @@ func (h *Handler) handleBoundaryUnion(w http.ResponseWriter, r *http.Request) {
 	// Compute new bounding box
 	var bbox *sites.BoundingBox
 	if len(newGeometry) > 0 {
-		var geom map[string]interface{}
-		if err := json.Unmarshal(newGeometry, &geom); err == nil {
-			bbox = &sites.BoundingBox{MinX: 180, MinY: 90, MaxX: -180, MaxY: -90}
-			extractBBoxFromGeom(geom, bbox)
+		if computed, err := sites.ComputeBoundingBox(newGeometry); err == nil {
+			bbox = computed
 		}
 	}
 
@@ -1719,10 +1655,8 @@ func (h *Handler) handleBoundaryDifference(w http.ResponseWriter, r *http.Reques
 	// Compute new bounding box
 	var bbox *sites.BoundingBox
 	if len(newGeometry) > 0 {
-		var geom map[string]interface{}
-		if err := json.Unmarshal(newGeometry, &geom); err == nil {
-			bbox = &sites.BoundingBox{MinX: 180, MinY: 90, MaxX: -180, MaxY: -90}
-			extractBBoxFromGeom(geom, bbox)
+		if computed, err := sites.ComputeBoundingBox(newGeometry); err == nil {
+			bbox = computed
 		}
 	}
 
@@ -128,3 +128,19 @@ func TestComparisonDataMissingParams(t *testing.T) {
 		}
 	}
 }
+
+func TestIsEmptyJSONValue(t *testing.T) {
+	cases := map[string]bool{
+		``:                       true,
+		`null`:                   true,
+		`{}`:                     true,
+		`{ }`:                    true,
+		`{"catchmentIds":["1"]}`: false,
+	}
+
+	for raw, expected := range cases {
+		if got := isEmptyJSONValue(json.RawMessage(raw)); got != expected {
+			t.Errorf("isEmptyJSONValue(%q): expected %v, got %v", raw, expected, got)
+		}
+	}
+}
@@ -47,12 +47,23 @@ type GeoJSONFeature struct {
 func NewGpkgStore(dataDir string) (*GpkgStore, error) {
 	gpkgPath := filepath.Join(dataDir, "datapack.gpkg")
 
-	// Open with spatialite extension
-	db, err := sql.Open("sqlite3", gpkgPath+"?mode=ro")
+	// _cache_size is applied by go-sqlite3 to each connection as its own private
+	// page cache. 8 MiB per connection (64 MiB across the pool below) keeps the
+	// wide scenario rows and their overflow pages resident, so repeated
+	// attribute and geometry lookups are served from memory instead of
+	// re-reading scattered pages from disk.
+	db, err := sql.Open("sqlite3", gpkgPath+"?mode=ro&_cache_size=-8192&_busy_timeout=5000")
 	if err != nil {
 		return nil, fmt.Errorf("failed to open geopackage: %w", err)
 	}
 
+	// Keep every pooled connection idle between requests rather than the
+	// database/sql default of 2, so their warm page caches are reused instead
+	// of being discarded. Capping open connections at the same 8 bounds total
+	// page cache memory at 64 MiB.
+	db.SetMaxOpenConns(8)
+	db.SetMaxIdleConns(8)
+
 	// Test connection
 	if err := db.Ping(); err != nil {
 		return nil, fmt.Errorf("failed to connect to geopackage: %w", err)
@@ -548,7 +559,7 @@ func (s *GpkgStore) DissolveCatchments(catchmentIDs []string) (json.RawMessage,
 	query := fmt.Sprintf(`
 		SELECT geojson
 		FROM catchments_lev12
-		WHERE HYBAS_ID IN (%s) AND geojson IS NOT NULL
+		WHERE HYBAS_ID_int IN (%s) AND geojson IS NOT NULL
 	`, strings.Join(placeholders, ","))
 
 	rows, err := s.db.Query(query, args...)
@@ -566,34 +577,36 @@ func (s *GpkgStore) DissolveCatchments(catchmentIDs []string) (json.RawMessage,
 			continue
 		}
 
-		// Parse as GeoJSON geometry
-		var geom map[string]interface{}
+		// Parse as GeoJSON geometry, leaving coordinates raw until the type is known
+		var geom struct {
+			Type        string          `json:"type"`
+			Coordinates json.RawMessage `json:"coordinates"`
+		}
 		if err := json.Unmarshal([]byte(geojsonStr), &geom); err != nil {
 			log.Printf("Failed to unmarshal geometry: %v", err)
 			continue
 		}
 
-		geomType, _ := geom["type"].(string)
-		coords := geom["coordinates"]
-
-		// Convert to polyclip polygon format
-		switch geomType {
+		// Decode coordinates straight into typed slices and convert to polyclip
+		switch geom.Type {
 		case "Polygon":
-			if c, ok := coords.([]interface{}); ok {
-				poly := geojsonToPolyclipPolygon(c)
-				if len(poly) > 0 {
-					polyPolygons = append(polyPolygons, poly)
-				}
+			var coords [][][]float64
+			if err := json.Unmarshal(geom.Coordinates, &coords); err != nil {
+				log.Printf("Failed to unmarshal polygon coordinates: %v", err)
+				continue
+			}
+			if poly := coordinatesToPolyclip(coords); len(poly) > 0 {
+				polyPolygons = append(polyPolygons, poly)
 			}
 		case "MultiPolygon":
-			if c, ok := coords.([]interface{}); ok {
-				for _, p := range c {
-					if pc, ok := p.([]interface{}); ok {
-						poly := geojsonToPolyclipPolygon(pc)
-						if len(poly) > 0 {
-							polyPolygons = append(polyPolygons, poly)
-						}
-					}
+			var multiCoords [][][][]float64
+			if err := json.Unmarshal(geom.Coordinates, &multiCoords); err != nil {
+				log.Printf("Failed to unmarshal multipolygon coordinates: %v", err)
+				continue
+			}
+			for _, coords := range multiCoords {
+				if poly := coordinatesToPolyclip(coords); len(poly) > 0 {
+					polyPolygons = append(polyPolygons, poly)
 				}
 			}
 		}
@@ -617,31 +630,6 @@ func (s *GpkgStore) DissolveCatchments(catchmentIDs []string) (json.RawMessage,
 	return polyclipPolygonToGeoJSON(result)
 }
 
-// geojsonToPolyclipPolygon converts GeoJSON polygon coordinates to polyclip.Polygon
-func geojsonToPolyclipPolygon(rings []interface{}) polyclip.Polygon {
-	poly := make(polyclip.Polygon, 0, len(rings))
-	for _, ring := range rings {
-		r, ok := ring.([]interface{})
-		if !ok {
-			continue
-		}
-		contour := make(polyclip.Contour, 0, len(r))
-		for _, coord := range r {
-			pt, ok := coord.([]interface{})
-			if !ok || len(pt) < 2 {
-				continue
-			}
-			x, _ := pt[0].(float64)
-			y, _ := pt[1].(float64)
-			contour = append(contour, polyclip.Point{X: x, Y: y})
-		}
-		if len(contour) > 0 {
-			poly = append(poly, contour)
-		}
-	}
-	return poly
-}
-
 // polyclipPolygonToGeoJSON converts polyclip.Polygon to GeoJSON
 func polyclipPolygonToGeoJSON(poly polyclip.Polygon) (json.RawMessage, float64, error) {
 	if len(poly) == 0 {
@@ -790,7 +778,7 @@ func (s *GpkgStore) GetCatchmentIndicatorsByIDs(ids []string) ([]CatchmentIndica
 		query := fmt.Sprintf(`
 			SELECT catchment_id, %s
 			FROM %s
-			WHERE catchment_id IN (%s)
+			WHERE catchment_id_int IN (%s)
 		`, strings.Join(quotedCols, ", "), tableName, strings.Join(placeholders, ","))
 
 		rows, err := s.db.Query(query, args...)
@@ -830,7 +818,7 @@ func (s *GpkgStore) GetCatchmentIndicatorsByIDs(ids []string) ([]CatchmentIndica
 	areaQuery := fmt.Sprintf(`
 		SELECT CAST(HYBAS_ID AS TEXT), SUB_AREA
 		FROM catchments_lev12
-		WHERE HYBAS_ID IN (%s)
+		WHERE HYBAS_ID_int IN (%s)
 	`, strings.Join(placeholders, ","))
 
 	areaRows, err := s.db.Query(areaQuery, args...)
@@ -868,6 +856,41 @@ func (s *GpkgStore) GetCatchmentIndicatorsByIDs(ids []string) ([]CatchmentIndica
 	return results, nil
 }
 
+// GetCatchmentsBoundingBox returns the combined extent of the given catchments as
+// minX, minY, maxX, maxY. The extent is read from the GeoPackage R-tree spatial
+// index, which already holds each feature's envelope, so no geometry needs to be
+// decoded.
+func (s *GpkgStore) GetCatchmentsBoundingBox(ids []string) (float64, float64, float64, float64, error) {
+	if len(ids) == 0 {
+		return 0, 0, 0, 0, fmt.Errorf("no catchment IDs provided")
+	}
+
+	// Build placeholders
+	placeholders := make([]string, len(ids))
+	args := make([]interface{}, len(ids))
+	for i, id := range ids {
+		placeholders[i] = "?"
+		args[i] = id
+	}
+
+	query := fmt.Sprintf(`
+		SELECT MIN(r.minx), MIN(r.miny), MAX(r.maxx), MAX(r.maxy)
+		FROM rtree_catchments_lev12_geom r
+		JOIN catchments_lev12 c ON c.fid = r.id
+		WHERE c.HYBAS_ID_int IN (%s)
+	`, strings.Join(placeholders, ","))
+
+	var minx, miny, maxx, maxy sql.NullFloat64
+	if err := s.db.QueryRow(query, args...).Scan(&minx, &miny, &maxx, &maxy); err != nil {
+		return 0, 0, 0, 0, fmt.Errorf("failed to query catchment extent: %w", err)
+	}
+	if !minx.Valid || !miny.Valid || !maxx.Valid || !maxy.Valid {
+		return 0, 0, 0, 0, fmt.Errorf("no indexed catchments found")
+	}
+
+	return minx.Float64, miny.Float64, maxx.Float64, maxy.Float64, nil
+}
+
 // GetCatchmentsByIDs returns catchment geometries for the given IDs
 func (s *GpkgStore) GetCatchmentsByIDs(ids []string) ([]GeoJSONFeature, error) {
 	if len(ids) == 0 {
@@ -885,7 +908,7 @@ func (s *GpkgStore) GetCatchmentsByIDs(ids []string) ([]GeoJSONFeature, error) {
 	query := fmt.Sprintf(`
 		SELECT HYBAS_ID, geojson
 		FROM catchments_lev12
-		WHERE HYBAS_ID IN (%s) AND geojson IS NOT NULL
+		WHERE HYBAS_ID_int IN (%s) AND geojson IS NOT NULL
 	`, strings.Join(placeholders, ","))
 
 	rows, err := s.db.Query(query, args...)
@@ -1019,9 +1042,12 @@ func geojsonToPolyclip(geom json.RawMessage) (polyclip.Polygon, error) {
 func coordinatesToPolyclip(coords [][][]float64) polyclip.Polygon {
 	poly := make(polyclip.Polygon, len(coords))
 	for i, ring := range coords {
-		contour := make(polyclip.Contour, len(ring))
-		for j, pt := range ring {
-			contour[j] = polyclip.Point{X: pt[0], Y: pt[1]}
+		contour := make(polyclip.Contour, 0, len(ring))
+		for _, pt := range ring {
+			if len(pt) < 2 {
+				continue
+			}
+			contour = append(contour, polyclip.Point{X: pt[0], Y: pt[1]})
 		}
 		poly[i] = contour
 	}
@@ -0,0 +1,76 @@
+package geodata
+
+import (
+	"database/sql"
+	"path/filepath"
+	"testing"
+
+	_ "github.com/mattn/go-sqlite3"
+)
+
+// createTestGpkg creates a temporary datapack.gpkg holding catchments_lev12 and
+// its R-tree spatial index for testing
+func createTestGpkg(t *testing.T, dir string) {
+	t.Helper()
+
+	db, err := sql.Open("sqlite3", filepath.Join(dir, "datapack.gpkg"))
+	if err != nil {
+		t.Fatalf("Failed to create test DB: %v", err)
+	}
+	defer db.Close()
+
+	statements := []string{
+		`CREATE TABLE catchments_lev12 (fid INTEGER PRIMARY KEY, HYBAS_ID TEXT, HYBAS_ID_int INTEGER, geom BLOB)`,
+		`CREATE VIRTUAL TABLE rtree_catchments_lev12_geom USING rtree(id, minx, maxx, miny, maxy)`,
+		`INSERT INTO catchments_lev12 (fid, HYBAS_ID, HYBAS_ID_int) VALUES (1, '1120000010', 1120000010)`,
+		`INSERT INTO catchments_lev12 (fid, HYBAS_ID, HYBAS_ID_int) VALUES (2, '1120000020', 1120000020)`,
+		`INSERT INTO catchments_lev12 (fid, HYBAS_ID, HYBAS_ID_int) VALUES (3, '1120000030', 1120000030)`,
+		`INSERT INTO rtree_catchments_lev12_geom VALUES (1, 20, 21, -30, -29)`,
+		`INSERT INTO rtree_catchments_lev12_geom VALUES (2, 24, 26, -28, -25)`,
+		// Catchment 3 has no spatial index entry
+	}
+
+	for _, stmt := range statements {
+		if _, err := db.Exec(stmt); err != nil {
+			t.Fatalf("Failed to execute: %s: %v", stmt, err)
+		}
+	}
+}
+
+func TestGetCatchmentsBoundingBox(t *testing.T) {
+	dir := t.TempDir()
+	createTestGpkg(t, dir)
+
+	store, err := NewGpkgStore(dir)
+	if err != nil {
+		t.Fatalf("NewGpkgStore failed: %v", err)
+	}
+	defer store.Close()
+
+	minX, minY, maxX, maxY, err := store.GetCatchmentsBoundingBox([]string{"1120000010", "1120000020"})
+	if err != nil {
+		t.Fatalf("GetCatchmentsBoundingBox failed: %v", err)
+	}
+
+	if minX != 20 || minY != -30 || maxX != 26 || maxY != -25 {
+		t.Errorf("Expected extent (20, -30, 26, -25), got (%v, %v, %v, %v)", minX, minY, maxX, maxY)
+	}
+}
+
+func TestGetCatchmentsBoundingBoxNotIndexed(t *testing.T) {
+	dir := t.TempDir()
+	createTestGpkg(t, dir)
+
+	store, err := NewGpkgStore(dir)
+	if err != nil {
+		t.Fatalf("NewGpkgStore failed: %v", err)
+	}
+	defer store.Close()
+
+	// Neither an unknown catchment nor one missing from the R-tree has an extent
+	for _, ids := range [][]string{{"999"}, {"1120000030"}} {
+		if _, _, _, _, err := store.GetCatchmentsBoundingBox(ids); err == nil {
+			t.Errorf("Expected error for catchments %v without indexed extents", ids)
+		}
+	}
+}
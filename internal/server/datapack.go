@@ -2,6 +2,7 @@ package server
 
 import (
 	"archive/zip"
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -277,6 +278,23 @@ func (s *Server) reloadDataStores(packDir string) {
 	s.rebuildRoutes()
 }
 
+// extractBufferSize is the size of the write buffer used when extracting
+// archive entries. The deflate reader returns at most 32 KB per Read, so
+// without buffering the output a multi-GB GeoPackage is written in 32 KB
+// syscalls.
+const extractBufferSize = 8 << 20
+
+// writeEntry copies an archive entry into dst through bw and flushes it.
+// dst is wrapped so that bw cannot hand the copy straight to
+// (*os.File).ReadFrom, which would write each 32 KB read unbuffered.
+func writeEntry(bw *bufio.Writer, dst *os.File, src io.Reader) error {
+	bw.Reset(struct{ io.Writer }{dst})
+	if _, err := io.Copy(bw, src); err != nil {
+		return err
+	}
+	return bw.Flush()
+}
+
 // extractDatapack unzips a data pack archive into destDir, preserving the
 // directory structure from the zip (e.g. a zip containing data/ will produce destDir/data/).
 func extractDatapack(zipPath, destDir string) error {
@@ -290,6 +308,7 @@ func extractDatapack(zipPath, destDir string) error {
 		return fmt.Errorf("empty zip archive")
 	}
 
+	bw := bufio.NewWriterSize(nil, extractBufferSize)
 	for _, f := range r.File {
 		// Sanitize path to prevent zip slip
 		destPath := filepath.Join(destDir, f.Name)
@@ -317,7 +336,7 @@ func extractDatapack(zipPath, destDir string) error {
 			return fmt.Errorf("could not open zip entry: %w", err)
 		}
 
-		_, err = io.Copy(outFile, rc)
+		err = writeEntry(bw, outFile, rc)
 		rc.Close()
 		outFile.Close()
 		if err != nil {
@@ -340,6 +359,7 @@ func extract7zDatapack(archivePath, destDir string) error {
 		return fmt.Errorf("empty 7z archive")
 	}
 
+	bw := bufio.NewWriterSize(nil, extractBufferSize)
 	for _, f := range r.File {
 		// Sanitize path to prevent zip slip
 		destPath := filepath.Join(destDir, f.Name)
@@ -367,7 +387,7 @@ func extract7zDatapack(archivePath, destDir string) error {
 			return fmt.Errorf("could not open archive entry: %w", err)
 		}
 
-		_, err = io.Copy(outFile, rc)
+		err = writeEntry(bw, outFile, rc)
 		rc.Close()
 		outFile.Close()
 		if err != nil {
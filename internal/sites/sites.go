@@ -167,7 +167,7 @@ func (s *Store) Create(site *Site) (*Site, error) {
 
 	// Compute bounding box if geometry is provided and bbox is not
 	if site.BoundingBox == nil && len(site.Geometry) > 0 {
-		bbox, err := computeBoundingBox(site.Geometry)
+		bbox, err := ComputeBoundingBox(site.Geometry)
 		if err == nil {
 			site.BoundingBox = bbox
 		}
@@ -223,7 +223,7 @@ func (s *Store) Update(id string, updates *Site) (*Site, error) {
 	if len(updates.Geometry) > 0 {
 		site.Geometry = updates.Geometry
 		// Recompute bounding box
-		bbox, err := computeBoundingBox(updates.Geometry)
+		bbox, err := ComputeBoundingBox(updates.Geometry)
 		if err == nil {
 			site.BoundingBox = bbox
 		}
@@ -339,9 +339,17 @@ func (s *Store) saveThumbnail(siteID, dataURL string) (string, error) {
 	return fmt.Sprintf("/data/images/%s", filename), nil
 }
 
-// computeBoundingBox extracts the bounding box from GeoJSON geometry
-func computeBoundingBox(geometry json.RawMessage) (*BoundingBox, error) {
-	var geom map[string]interface{}
+// geometryJSON is a GeoJSON geometry whose coordinates are decoded lazily,
+// once the type is known, straight into typed coordinate slices
+type geometryJSON struct {
+	Type        string            `json:"type"`
+	Coordinates json.RawMessage   `json:"coordinates"`
+	Geometries  []json.RawMessage `json:"geometries"`
+}
+
+// ComputeBoundingBox extracts the bounding box from GeoJSON geometry
+func ComputeBoundingBox(geometry json.RawMessage) (*BoundingBox, error) {
+	var geom geometryJSON
 	if err := json.Unmarshal(geometry, &geom); err != nil {
 		return nil, err
 	}
@@ -359,82 +367,56 @@ func computeBoundingBox(geometry json.RawMessage) (*BoundingBox, error) {
 	return bbox, nil
 }
 
-// extractCoords recursively extracts coordinates from GeoJSON
-func extractCoords(geom map[string]interface{}, bbox *BoundingBox) {
-	geomType, _ := geom["type"].(string)
-
-	switch geomType {
+// extractCoords decodes the coordinates of a GeoJSON geometry into typed
+// slices and folds every vertex into the bounding box. Geometries whose
+// coordinates cannot be decoded are skipped.
+func extractCoords(geom geometryJSON, bbox *BoundingBox) {
+	switch geom.Type {
 	case "Point":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok && len(coords) >= 2 {
-			x, _ := coords[0].(float64)
-			y, _ := coords[1].(float64)
-			updateBBox(bbox, x, y)
+		var pt []float64
+		if json.Unmarshal(geom.Coordinates, &pt) == nil && len(pt) >= 2 {
+			updateBBox(bbox, pt[0], pt[1])
 		}
 	case "LineString", "MultiPoint":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok {
-			for _, c := range coords {
-				pt, ok := c.([]interface{})
-				if ok && len(pt) >= 2 {
-					x, _ := pt[0].(float64)
-					y, _ := pt[1].(float64)
-					updateBBox(bbox, x, y)
-				}
-			}
+		var points [][]float64
+		if json.Unmarshal(geom.Coordinates, &points) == nil {
+			updateBBoxPoints(bbox, points)
 		}
 	case "Polygon", "MultiLineString":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok {
-			for _, ring := range coords {
-				r, ok := ring.([]interface{})
-				if ok {
-					for _, c := range r {
-						pt, ok := c.([]interface{})
-						if ok && len(pt) >= 2 {
-							x, _ := pt[0].(float64)
-							y, _ := pt[1].(float64)
-							updateBBox(bbox, x, y)
-						}
-					}
-				}
+		var rings [][][]float64
+		if json.Unmarshal(geom.Coordinates, &rings) == nil {
+			for _, ring := range rings {
+				updateBBoxPoints(bbox, ring)
 			}
 		}
 	case "MultiPolygon":
-		coords, ok := geom["coordinates"].([]interface{})
-		if ok {
-			for _, polygon := range coords {
-				p, ok := polygon.([]interface{})
-				if ok {
-					for _, ring := range p {
-						r, ok := ring.([]interface{})
-						if ok {
-							for _, c := range r {
-								pt, ok := c.([]interface{})
-								if ok && len(pt) >= 2 {
-									x, _ := pt[0].(float64)
-									y, _ := pt[1].(float64)
-									updateBBox(bbox, x, y)
-								}
-							}
-						}
-					}
+		var polygons [][][][]float64
+		if json.Unmarshal(geom.Coordinates, &polygons) == nil {
+			for _, polygon := range polygons {
+				for _, ring := range polygon {
+					updateBBoxPoints(bbox, ring)
 				}
 			}
 		}
 	case "GeometryCollection":
-		geometries, ok := geom["geometries"].([]interface{})
-		if ok {
-			for _, g := range geometries {
-				gmap, ok := g.(map[string]interface{})
-				if ok {
-					extractCoords(gmap, bbox)
-				}
+		for _, raw := range geom.Geometries {
+			var g geometryJSON
+			if json.Unmarshal(raw, &g) == nil {
+				extractCoords(g, bbox)
 			}
 		}
 	}
 }
 
+// updateBBoxPoints folds a run of [x, y] positions into the bounding box
+func updateBBoxPoints(bbox *BoundingBox, points [][]float64) {
+	for _, pt := range points {
+		if len(pt) >= 2 {
+			updateBBox(bbox, pt[0], pt[1])
+		}
+	}
+}
+
 func updateBBox(bbox *BoundingBox, x, y float64) {
 	if x < bbox.MinX {
 		bbox.MinX = x
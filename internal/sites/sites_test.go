@@ -0,0 +1,60 @@
+package sites
+
+import (
+	"encoding/json"
+	"testing"
+)
+
+func TestComputeBoundingBoxPolygon(t *testing.T) {
+	geom := json.RawMessage(`{"type":"Polygon","coordinates":[[[20,-30],[22.5,-30],[22.5,-28],[20,-28],[20,-30]]]}`)
+
+	bbox, err := ComputeBoundingBox(geom)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	expected := BoundingBox{MinX: 20, MinY: -30, MaxX: 22.5, MaxY: -28}
+	if *bbox != expected {
+		t.Errorf("Expected %+v, got %+v", expected, *bbox)
+	}
+}
+
+func TestComputeBoundingBoxMultiPolygon(t *testing.T) {
+	geom := json.RawMessage(`{"type":"MultiPolygon","coordinates":[
+		[[[20,-30],[21,-30],[21,-29],[20,-30]]],
+		[[[25,-26,100],[26,-26,100],[26,-24,100],[25,-26,100]]]
+	]}`)
+
+	bbox, err := ComputeBoundingBox(geom)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	expected := BoundingBox{MinX: 20, MinY: -30, MaxX: 26, MaxY: -24}
+	if *bbox != expected {
+		t.Errorf("Expected %+v, got %+v", expected, *bbox)
+	}
+}
+
+func TestComputeBoundingBoxGeometryCollection(t *testing.T) {
+	geom := json.RawMessage(`{"type":"GeometryCollection","geometries":[
+		{"type":"Point","coordinates":[18,-33]},
+		{"type":"LineString","coordinates":[[19,-34],[31,-22]]}
+	]}`)
+
+	bbox, err := ComputeBoundingBox(geom)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	expected := BoundingBox{MinX: 18, MinY: -34, MaxX: 31, MaxY: -22}
+	if *bbox != expected {
+		t.Errorf("Expected %+v, got %+v", expected, *bbox)
+	}
+}
+
+func TestComputeBoundingBoxInvalidJSON(t *testing.T) {
+	if _, err := ComputeBoundingBox(json.RawMessage(`{not json`)); err == nil {
+		t.Error("Expected error for invalid geometry JSON")
+	}
+}
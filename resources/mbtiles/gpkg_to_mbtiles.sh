@@ -29,7 +29,7 @@ set -euo pipefail
 # 2. Detects all feature layers from gpkg_contents
 # 3. Checks for NULL geometries
 # 4. Optionally fixes geometries using ogr2ogr -makevalid
-# 5. Exports each layer to GeoJSONSeq
+# 5. Exports each layer to GeoJSONSeq (several layers in parallel)
 # 6. Builds ONE MBTiles PER LAYER (layer-specific zoom levels)
 # 7. Merges them using tile-join
 #
@@ -117,7 +117,20 @@ DEFAULT_ZOOMS="6 15"
 # WORKDIR
 # -----------------------------
 WORKDIR="$(mktemp -d)"
-trap 'rm -rf "$WORKDIR"' EXIT
+
+# Background GeoJSONSeq exports (see below). If the script exits early, stop any
+# still running, along with their ogr2ogr children, so they don't keep writing
+# into the removed work directory.
+EXPORT_PIDS=()
+cleanup() {
+  local PID CHILDREN
+  for PID in ${EXPORT_PIDS[@]+"${EXPORT_PIDS[@]}"}; do
+    CHILDREN=$(pgrep -P "$PID" 2>/dev/null || true)
+    kill "$PID" $CHILDREN 2>/dev/null || true
+  done
+  rm -rf "$WORKDIR"
+}
+trap cleanup EXIT
 
 VALIDATED_GPKG="$WORKDIR/validated.gpkg"
 GEOJSON_DIR="$WORKDIR/geojson"
@@ -182,10 +195,10 @@ get_geometry_column() {
 # -----------------------------
 # EXPORT TO GEOJSONSEQ
 # -----------------------------
-info "Exporting layers to GeoJSONSeq..."
-
-while read -r LAYER; do
-  OUT="$GEOJSON_DIR/$LAYER.jsonseq"
+export_layer() {
+  local LAYER="$1"
+  local OUT="$GEOJSON_DIR/$LAYER.jsonseq"
+  local GEOM_COL
   GEOM_COL=$(get_geometry_column "$VALIDATED_GPKG" "$LAYER")
 
   if [[ -n "$GEOM_COL" ]]; then
@@ -196,8 +209,35 @@ while read -r LAYER; do
   else
     ogr2ogr -f GeoJSONSeq "$OUT" "$VALIDATED_GPKG" "$LAYER" -nlt PROMOTE_TO_MULTI
   fi
+}
+
+# Layers are independent and each ogr2ogr export is single-threaded, so run
+# them in parallel, capped at half the available cores (nproc is GNU-only,
+# macOS reports the count through sysctl)
+CPU_COUNT=$(nproc 2>/dev/null || getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 2)
+MAX_JOBS=$(( CPU_COUNT / 2 ))
+[[ "$MAX_JOBS" -lt 1 ]] && MAX_JOBS=1
+
+info "Exporting layers to GeoJSONSeq ($MAX_JOBS in parallel)..."
+
+# When MAX_JOBS exports are running, wait for the oldest one before starting
+# the next (plain `wait PID` rather than `wait -n`, which needs bash 4.3).
+# Waiting on each PID also makes a failed export fail the build.
+NEXT_WAIT=0
+while read -r LAYER; do
+  if (( ${#EXPORT_PIDS[@]} - NEXT_WAIT >= MAX_JOBS )); then
+    wait "${EXPORT_PIDS[$NEXT_WAIT]}"
+    NEXT_WAIT=$(( NEXT_WAIT + 1 ))
+  fi
+  export_layer "$LAYER" &
+  EXPORT_PIDS+=("$!")
 done <<< "$MAP_LAYERS"
 
+for PID in "${EXPORT_PIDS[@]:$NEXT_WAIT}"; do
+  wait "$PID"
+done
+EXPORT_PIDS=()
+
 
 # -----------------------------
 # BUILD PER-LAYER MBTILES
@@ -15,7 +15,12 @@
 set -e
 
 DATA_DIR="${1:-./data}"
-OUTPUT="$DATA_DIR/datapack.gpkg"
+FINAL_OUTPUT="$DATA_DIR/datapack.gpkg"
+
+# Build into a scratch geopackage and move it into place once complete, so a
+# failed build never leaves a half-written datapack behind
+OUTPUT="$DATA_DIR/.datapack.build.gpkg"
+trap 'rm -f "$OUTPUT"' EXIT
 
 echo "Building datapack from $DATA_DIR..."
 
@@ -27,7 +32,29 @@ for f in catchments.gpkg current.csv reference.csv; do
     fi
 done
 
-# Remove existing output
+# Skip the rebuild when the inputs haven't changed since the last one. The
+# stamp records the size and modification time of each input (and of this
+# script); delete data/datapack.gpkg.stamp to force a rebuild. It is computed
+# with python3 because stat's flags differ between GNU and BSD/macOS; if that
+# fails, set -e stops the build instead of comparing an empty stamp.
+STAMP_FILE="$FINAL_OUTPUT.stamp"
+INPUT_STAMP=$(python3 - "$DATA_DIR"/catchments.gpkg "$DATA_DIR"/current.csv "$DATA_DIR"/reference.csv \
+    "$DATA_DIR"/medata.csv "$DATA_DIR"/metadata.csv "${BASH_SOURCE[0]}" <<'STAMPPY'
+import os
+import sys
+
+for path in sys.argv[1:]:
+    if os.path.isfile(path):
+        st = os.stat(path)
+        print(f"{os.path.basename(path)} {st.st_size}:{int(st.st_mtime)}")
+STAMPPY
+)
+if [ -f "$FINAL_OUTPUT" ] && [ -f "$STAMP_FILE" ] && [ "$(cat "$STAMP_FILE")" = "$INPUT_STAMP" ]; then
+    echo "$FINAL_OUTPUT is up to date with its inputs, nothing to do."
+    exit 0
+fi
+
+# Remove any leftover scratch output
 rm -f "$OUTPUT"
 
 # Copy the catchments geopackage as the base
@@ -58,87 +85,25 @@ elif [ -f "$DATA_DIR/metadata.csv" ]; then
         "$DATA_DIR/metadata.csv"
 fi
 
-# Convert all data columns to REAL type and NA strings to NULL
-# This ensures proper numeric handling for min/max and color scaling
-echo "Converting columns to REAL type (NA -> NULL)..."
-python3 - "$OUTPUT" <<'TYPEPY'
-import sqlite3
-import sys
-
-gpkg_path = sys.argv[1]
-conn = sqlite3.connect(gpkg_path)
-cur = conn.cursor()
-
-def convert_table_types(raw_table, target_table):
-    """Convert a raw imported table to proper types: ID columns stay text, all others become REAL."""
-    cur.execute(f"PRAGMA table_info({raw_table})")
-    columns = [(row[1], row[2]) for row in cur.fetchall()]  # (name, type)
-
-    # ID columns that should remain as-is
-    id_columns = {'fid', 'ogc_fid', 'catchID', 'catchment_id', 'sp_current.catchID',
-                  'sp_reference$catchID', 'sp_reference.catchID'}
-
-    # Build column definitions and select expressions
-    col_defs = []
-    select_parts = []
-
-    for col_name, col_type in columns:
-        if col_name in id_columns:
-            # Keep ID columns as their original type
-            col_defs.append(f'"{col_name}" {col_type}')
-            select_parts.append(f'"{col_name}"')
-        else:
-            # Convert data columns to REAL, with NA -> NULL
-            col_defs.append(f'"{col_name}" REAL')
-            # CASE expression: if value is 'NA' or empty, return NULL, else cast to REAL
-            select_parts.append(f'CASE WHEN "{col_name}" = \'NA\' OR "{col_name}" = \'\' THEN NULL ELSE CAST("{col_name}" AS REAL) END as "{col_name}"')
-
-    # Create new table with proper types
-    cur.execute(f"DROP TABLE IF EXISTS {target_table}")
-    cur.execute(f"CREATE TABLE {target_table} ({', '.join(col_defs)})")
-
-    # Copy data with type conversion
-    cur.execute(f"INSERT INTO {target_table} SELECT {', '.join(select_parts)} FROM {raw_table}")
-
-    # Drop raw table and clean up gpkg_contents reference
-    cur.execute(f"DROP TABLE {raw_table}")
-    cur.execute(f"DELETE FROM gpkg_contents WHERE table_name = '{raw_table}'")
-    cur.execute(f"DELETE FROM gpkg_geometry_columns WHERE table_name = '{raw_table}'")
-
-    conn.commit()
-
-    # Count non-null values in first data column to verify
-    first_data_col = None
-    for col_name, _ in columns:
-        if col_name not in id_columns:
-            first_data_col = col_name
-            break
-
-    if first_data_col:
-        cur.execute(f'SELECT COUNT(*) FROM {target_table} WHERE "{first_data_col}" IS NOT NULL')
-        count = cur.fetchone()[0]
-        print(f"  {target_table}: Converted {len(columns)} columns, {count} rows with non-null data")
-
-convert_table_types("scenario_current_raw", "scenario_current")
-convert_table_types("scenario_reference_raw", "scenario_reference")
-
-conn.close()
-print("  Done converting column types")
-TYPEPY
-
-# Normalize column names to ensure both tables have identical structure
+# Convert all data columns to REAL type and NA strings to NULL, and normalize
+# column names so both tables have identical structure. Both happen in a single
+# CREATE/INSERT per table so each scenario table is only rewritten once.
 # The input CSVs may have different naming conventions (dots vs dashes/spaces)
 # We normalize to dots (.) as the separator character
-echo "Normalizing column names..."
-python3 - "$OUTPUT" <<'NORMPY'
+echo "Converting columns to REAL type (NA -> NULL) and normalizing names..."
+python3 - "$OUTPUT" <<'TYPEPY'
+import re
 import sqlite3
 import sys
-import re
 
 gpkg_path = sys.argv[1]
 conn = sqlite3.connect(gpkg_path)
 cur = conn.cursor()
 
+# ID columns that should remain as-is
+id_columns = {'fid', 'ogc_fid', 'catchID', 'catchment_id', 'sp_current.catchID',
+              'sp_reference$catchID', 'sp_reference.catchID'}
+
 def normalize_column_name(name):
     """Normalize column name: replace dashes, spaces, apostrophes, etc. with dots."""
     # Rename the main catchID column to 'catchment_id'
@@ -166,57 +131,82 @@ def normalize_column_name(name):
     result = result.replace('+', '.')
     # Normalize multiple dots to a single dot (current.csv uses ... vs reference.csv uses .)
     # This handles cases like "browser.frugivores...closed" vs "browser.frugivores.closed"
-    import re
     result = re.sub(r'\.{2,}', '.', result)
     return result
 
-def rename_columns(table_name):
-    """Rename columns in a table to use normalized names. Drops columns where normalize returns None."""
-    cur.execute(f"PRAGMA table_info({table_name})")
+def convert_table_types(raw_table, target_table):
+    """Convert a raw imported table to proper types and normalized names in one pass.
+
+    ID columns stay text, all others become REAL. Duplicate catchID columns are dropped.
+    """
+    cur.execute(f"PRAGMA table_info({raw_table})")
     columns = [(row[1], row[2]) for row in cur.fetchall()]  # (name, type)
 
+    # Build column definitions and select expressions
+    col_defs = []
+    select_parts = []
     renames = []
     drops = []
+    first_data_col = None
+    id_source = None
+
     for col_name, col_type in columns:
         new_name = normalize_column_name(col_name)
         if new_name is None:
             drops.append(col_name)
-        elif new_name != col_name:
+            continue
+        if new_name != col_name:
             renames.append((col_name, new_name))
+        if new_name == 'catchment_id':
+            id_source = col_name
 
-    if not renames and not drops:
-        print(f"  {table_name}: No columns need changes")
-        return
+        if col_name in id_columns:
+            # Keep ID columns as their original type
+            col_defs.append(f'"{new_name}" {col_type}')
+            select_parts.append(f'"{col_name}" as "{new_name}"')
+        else:
+            # Convert data columns to REAL, with NA -> NULL
+            col_defs.append(f'"{new_name}" REAL')
+            # CASE expression: if value is 'NA' or empty, return NULL, else cast to REAL
+            select_parts.append(f'CASE WHEN "{col_name}" = \'NA\' OR "{col_name}" = \'\' THEN NULL ELSE CAST("{col_name}" AS REAL) END as "{new_name}"')
+            if first_data_col is None:
+                first_data_col = new_name
 
-    # SQLite doesn't support ALTER TABLE RENAME COLUMN in older versions
-    # We need to recreate the table with new column names
-    print(f"  {table_name}: Renaming {len(renames)} columns, dropping {len(drops)} columns...")
+    # Integer copy of the catchment ID for indexed joins, built in the same pass
+    # rather than added and backfilled afterwards
+    if id_source is not None:
+        col_defs.append('"catchment_id_int" INTEGER')
+        select_parts.append(f'CAST("{id_source}" AS INTEGER) as "catchment_id_int"')
+
+    # Create new table with proper types
+    cur.execute(f"DROP TABLE IF EXISTS {target_table}")
+    cur.execute(f"CREATE TABLE {target_table} ({', '.join(col_defs)})")
+
+    # Copy data with type conversion and renaming
+    cur.execute(f"INSERT INTO {target_table} SELECT {', '.join(select_parts)} FROM {raw_table}")
+
+    # Drop raw table and clean up gpkg_contents reference
+    cur.execute(f"DROP TABLE {raw_table}")
+    cur.execute(f"DELETE FROM gpkg_contents WHERE table_name = '{raw_table}'")
+    cur.execute(f"DELETE FROM gpkg_geometry_columns WHERE table_name = '{raw_table}'")
 
-    # Build column mapping (excluding dropped columns)
-    col_map = {old: new for old, new in renames}
-    new_columns = []
-    select_parts = []
-    for col_name, col_type in columns:
-        if col_name in drops:
-            continue  # Skip dropped columns
-        new_name = col_map.get(col_name, col_name)
-        new_columns.append(f'"{new_name}" {col_type}')
-        select_parts.append(f'"{col_name}" as "{new_name}"')
-
-    # Create new table, copy data, drop old, rename new
-    cur.execute(f"CREATE TABLE {table_name}_new ({', '.join(new_columns)})")
-    cur.execute(f"INSERT INTO {table_name}_new SELECT {', '.join(select_parts)} FROM {table_name}")
-    cur.execute(f"DROP TABLE {table_name}")
-    cur.execute(f"ALTER TABLE {table_name}_new RENAME TO {table_name}")
     conn.commit()
 
-    for old, new in renames[:5]:  # Show first 5
-        print(f"    {old} -> {new}")
-    if len(renames) > 5:
-        print(f"    ... and {len(renames) - 5} more")
+    # Count non-null values in first data column to verify
+    if first_data_col:
+        cur.execute(f'SELECT COUNT(*) FROM {target_table} WHERE "{first_data_col}" IS NOT NULL')
+        count = cur.fetchone()[0]
+        print(f"  {target_table}: Converted {len(col_defs)} columns, {count} rows with non-null data")
+
+    if renames or drops:
+        print(f"  {target_table}: Renamed {len(renames)} columns, dropped {len(drops)} columns")
+        for old, new in renames[:5]:  # Show first 5
+            print(f"    {old} -> {new}")
+        if len(renames) > 5:
+            print(f"    ... and {len(renames) - 5} more")
 
-rename_columns("scenario_current")
-rename_columns("scenario_reference")
+convert_table_types("scenario_current_raw", "scenario_current")
+convert_table_types("scenario_reference_raw", "scenario_reference")
 
 # Verify both tables now have matching column names
 cur.execute("PRAGMA table_info(scenario_current)")
@@ -239,11 +229,11 @@ else:
         print(f"  WARNING: Columns only in scenario_reference: {list(only_reference)[:5]}")
 
 conn.close()
-print("  Done normalizing column names")
-NORMPY
+print("  Done converting column types and names")
+TYPEPY
 
 # Create index on catchID columns for fast joins
-# First, convert catchID to integer for proper indexing
+# (the integer catchment_id columns are built during type conversion)
 echo "Creating indexes..."
 
 # Drop SpatiaLite triggers that use functions we don't have
@@ -259,13 +249,8 @@ DROP TRIGGER IF EXISTS trigger_delete_feature_count_catchments_lev12;
 EOF
 
 sqlite3 "$OUTPUT" <<EOF
--- Add an integer catchment_id column for proper indexing
-ALTER TABLE scenario_current ADD COLUMN catchment_id_int INTEGER;
-UPDATE scenario_current SET catchment_id_int = CAST(catchment_id AS INTEGER);
+-- Index the integer catchment_id column built during type conversion
 CREATE INDEX IF NOT EXISTS idx_current_catchment_id_int ON scenario_current(catchment_id_int);
-
-ALTER TABLE scenario_reference ADD COLUMN catchment_id_int INTEGER;
-UPDATE scenario_reference SET catchment_id_int = CAST(catchment_id AS INTEGER);
 CREATE INDEX IF NOT EXISTS idx_reference_catchment_id_int ON scenario_reference(catchment_id_int);
 
 -- Also create an integer index on HYBAS_ID in catchments_lev12
@@ -278,12 +263,21 @@ EOF
 # This avoids expensive WKB-to-GeoJSON conversion at runtime
 echo "Computing GeoJSON geometries..."
 python3 - "$OUTPUT" <<'PYEOF'
+import json
+import multiprocessing
+import os
 import sqlite3
+import struct
 import sys
-import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 gpkg_path = sys.argv[1]
 conn = sqlite3.connect(gpkg_path)
+# Read geometry pages straight from a memory map of the file rather than
+# copying each one into SQLite's page cache
+conn.execute("PRAGMA mmap_size = 1073741824")
 cur = conn.cursor()
 
 # Add geojson column if it doesn't exist
@@ -292,11 +286,30 @@ try:
 except sqlite3.OperationalError:
     pass  # Column already exists
 
-# Get all catchments with geometry
-cur.execute("SELECT fid, geom FROM catchments_lev12 WHERE geom IS NOT NULL")
-rows = cur.fetchall()
-
-print(f"Converting {len(rows)} geometries to GeoJSON...")
+# The choropleth and site-extent queries prune catchments through the GeoPackage
+# R-tree spatial index. If the source geopackage shipped without one, create it
+# here and fill it from the envelopes of the geometries decoded below.
+cur.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'rtree_catchments_lev12_geom'")
+build_rtree = cur.fetchone()[0] == 0
+if build_rtree:
+    print("No spatial index found, building rtree_catchments_lev12_geom...")
+    cur.execute("CREATE VIRTUAL TABLE rtree_catchments_lev12_geom USING rtree(id, minx, maxx, miny, maxy)")
+    cur.execute("""CREATE TABLE IF NOT EXISTS gpkg_extensions (
+        table_name TEXT, column_name TEXT, extension_name TEXT NOT NULL,
+        definition TEXT NOT NULL, scope TEXT NOT NULL,
+        CONSTRAINT ge_tce UNIQUE (table_name, column_name, extension_name))""")
+    cur.execute("""INSERT OR IGNORE INTO gpkg_extensions VALUES
+        ('catchments_lev12', 'geom', 'gpkg_rtree_index',
+         'http://www.geopackage.org/spec120/#extension_rtree', 'write-only')""")
+
+# Count catchments with geometry (the geometries themselves are streamed below).
+# Every row is converted, even if the source geopackage already ships a geojson
+# column: that GeoJSON would not share the COORD_PRECISION rounding below, and
+# neighbouring catchments would no longer have identical shared vertices.
+cur.execute("SELECT COUNT(*) FROM catchments_lev12 WHERE geom IS NOT NULL")
+total = cur.fetchone()[0]
+
+print(f"Converting {total} geometries to GeoJSON...")
 
 def gpb_to_geojson(gpb):
     """Convert GeoPackage Binary to GeoJSON dict."""
@@ -341,10 +354,11 @@ def wkb_to_geojson(wkb):
         return parse_multipolygon(wkb, big_endian)
     return None
 
-def read_float64(data, offset, big_endian):
-    import struct
-    fmt = '>d' if big_endian else '<d'
-    return struct.unpack(fmt, data[offset:offset+8])[0]
+def read_ring(wkb, offset, big_endian, num_points):
+    """Decode a ring's interleaved x/y doubles with a single unpack over the flat buffer."""
+    fmt = ('>' if big_endian else '<') + str(2 * num_points) + 'd'
+    flat = struct.unpack_from(fmt, wkb, offset)
+    return list(zip(flat[0::2], flat[1::2])), offset + 16 * num_points
 
 def parse_polygon(wkb, big_endian):
     offset = 5
@@ -362,12 +376,7 @@ def parse_polygon(wkb, big_endian):
             num_points = int.from_bytes(wkb[offset:offset+4], 'little')
         offset += 4
 
-        ring = []
-        for _ in range(num_points):
-            x = read_float64(wkb, offset, big_endian)
-            y = read_float64(wkb, offset + 8, big_endian)
-            offset += 16
-            ring.append([x, y])
+        ring, offset = read_ring(wkb, offset, big_endian, num_points)
         rings.append(ring)
 
     return {"type": "Polygon", "coordinates": rings}
@@ -399,38 +408,103 @@ def parse_multipolygon(wkb, big_endian):
                 num_points = int.from_bytes(wkb[offset:offset+4], 'little')
             offset += 4
 
-            ring = []
-            for _ in range(num_points):
-                x = read_float64(wkb, offset, big_endian)
-                y = read_float64(wkb, offset + 8, big_endian)
-                offset += 16
-                ring.append([x, y])
+            ring, offset = read_ring(wkb, offset, big_endian, num_points)
             rings.append(ring)
         polygons.append(rings)
 
     return {"type": "MultiPolygon", "coordinates": polygons}
 
-# Process in batches
-batch_size = 1000
-updates = []
-for i, (fid, geom) in enumerate(rows):
-    if geom:
+def envelope(geojson):
+    """Return (minx, maxx, miny, maxy) of a decoded Polygon/MultiPolygon, or None if empty."""
+    polygons = geojson["coordinates"]
+    if geojson["type"] == "Polygon":
+        polygons = [polygons]
+    xs = [x for polygon in polygons for ring in polygon for x, _ in ring]
+    ys = [y for polygon in polygons for ring in polygon for _, y in ring]
+    if not xs:
+        return None
+    return min(xs), max(xs), min(ys), max(ys)
+
+# GeoJSON coordinates are rounded to 6 decimal places (~0.1 m at the equator),
+# far below the resolution of the source catchment polygons. Full float64
+# precision would spend ~17 significant digits per value in the geojson column
+# and in every choropleth response for detail nobody can see. Shared vertices
+# of neighbouring catchments round identically, so they still line up when
+# catchments are dissolved. Only the serialised GeoJSON is rounded: R-tree
+# envelopes are taken from the exact coordinates so they always contain geom.
+COORD_PRECISION = 6
+
+def round_coordinates(geojson):
+    """Return a copy of a decoded Polygon/MultiPolygon with coordinates rounded to COORD_PRECISION."""
+    def round_ring(ring):
+        flat = [v for point in ring for v in point]
+        flat = list(map(round, flat, repeat(COORD_PRECISION, len(flat))))
+        return list(zip(flat[0::2], flat[1::2]))
+
+    if geojson["type"] == "Polygon":
+        coordinates = [round_ring(ring) for ring in geojson["coordinates"]]
+    else:
+        coordinates = [[round_ring(ring) for ring in polygon] for polygon in geojson["coordinates"]]
+    return {"type": geojson["type"], "coordinates": coordinates}
+
+def convert_batch(rows, with_extents):
+    """Convert a batch of (fid, gpb) rows into GeoJSON updates and R-tree extents."""
+    updates = []
+    extents = []
+    for fid, geom in rows:
         geojson = gpb_to_geojson(geom)
         if geojson:
+            if with_extents:
+                extent = envelope(geojson)
+                if extent:
+                    extents.append((fid, *extent))
+            geojson = round_coordinates(geojson)
             updates.append((json.dumps(geojson, separators=(',', ':')), fid))
+    return updates, extents
 
-    if len(updates) >= batch_size:
+def write_batch(count, future):
+    """Write a converted batch back to the geopackage."""
+    global processed
+    updates, extents = future.result()
+    if updates:
         cur.executemany("UPDATE catchments_lev12 SET geojson = ? WHERE fid = ?", updates)
-        conn.commit()
-        print(f"  Processed {i+1}/{len(rows)}...")
-        updates = []
-
-# Final batch
-if updates:
-    cur.executemany("UPDATE catchments_lev12 SET geojson = ? WHERE fid = ?", updates)
+    if extents:
+        cur.executemany("INSERT INTO rtree_catchments_lev12_geom VALUES (?, ?, ?, ?, ?)", extents)
     conn.commit()
+    processed += count
+    print(f"  Processed {processed}/{total}...")
+
+# Process in batches, paging through the table by fid. WKB decoding and JSON
+# encoding are CPU-bound, so batches are converted in a pool of worker processes
+# while this process reads the next pages and writes results back. Two batches
+# per worker are kept in flight, and the batch size shrinks on machines with
+# many cores so that no more than max_rows_in_flight geometries (and their
+# converted GeoJSON) are held in memory at once, whatever the core count.
+max_rows_in_flight = 32768
+workers = max(1, (os.cpu_count() or 2) - 1)
+batch_size = max(1, min(8192, max_rows_in_flight // (2 * workers)))
+processed = 0
+last_fid = float('-inf')
+pending = deque()
+# fork: workers inherit the converter functions defined in this stdin script
+with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+    while True:
+        cur.execute(
+            "SELECT fid, geom FROM catchments_lev12 WHERE geom IS NOT NULL AND fid > ? ORDER BY fid LIMIT ?",
+            (last_fid, batch_size))
+        rows = cur.fetchall()
+        if not rows:
+            break
+
+        last_fid = rows[-1][0]
+        pending.append((len(rows), pool.submit(convert_batch, rows, build_rtree)))
+        if len(pending) >= 2 * workers:
+            write_batch(*pending.popleft())
 
-print(f"Done converting {len(rows)} geometries.")
+    while pending:
+        write_batch(*pending.popleft())
+
+print(f"Done converting {total} geometries.")
 
 # Restore the triggers (commented out - they use SpatiaLite functions we don't have)
 # But since we're not modifying geometry, we don't need them for our use case
@@ -447,7 +521,7 @@ PYEOF
 
 # Create domain_minima and domain_maxima tables
 # These store the min/max values across both scenarios for consistent color scaling
-# Use a single SQL query that computes all min/max in ONE pass through the data
+# Both are computed together in ONE pass through the data
 echo "Computing domain minima and maxima tables..."
 
 # Get column names (excluding ID columns)
@@ -456,26 +530,19 @@ COLUMNS=$(sqlite3 "$OUTPUT" "PRAGMA table_info(scenario_current)" | \
     grep -v -E '^(fid|catchment_id|catchment_id_int|ogc_fid)$')
 
 NUM_COLS=$(echo "$COLUMNS" | wc -l)
-echo "  Computing min/max for $NUM_COLS attribute columns in a single pass..."
-
-# Build a single SQL query that computes min/max for ALL columns at once
-# This does ONE table scan instead of 924 separate queries
-MIN_EXPRS=""
-MAX_EXPRS=""
-COL_DEFS=""
-
-for col in $COLUMNS; do
-    if [ -n "$MIN_EXPRS" ]; then
-        MIN_EXPRS="$MIN_EXPRS, "
-        MAX_EXPRS="$MAX_EXPRS, "
-        COL_DEFS="$COL_DEFS, "
-    fi
-    MIN_EXPRS="${MIN_EXPRS}MIN(CAST(\"$col\" AS REAL)) as \"$col\""
-    MAX_EXPRS="${MAX_EXPRS}MAX(CAST(\"$col\" AS REAL)) as \"$col\""
-    COL_DEFS="${COL_DEFS}\"$col\" REAL"
-done
+echo "  Computing min/max for $NUM_COLS attribute columns..."
+
+# Build the column list, table definition and per-column MIN/MAX expressions
+# (columns are already REAL type with NULL for NA values). Columns are listed
+# explicitly so both scenarios line up by name in the UNION ALL.
+COL_LIST=$(echo "$COLUMNS" | while read col; do
+    echo "\"$col\""
+done | paste -sd',')
+
+COL_DEFS=$(echo "$COLUMNS" | while read col; do
+    echo "\"$col\" REAL"
+done | paste -sd',')
 
-# Build MIN/MAX expressions (columns are already REAL type with NULL for NA values)
 MIN_SELECT=$(echo "$COLUMNS" | while read col; do
     echo "MIN(\"$col\") as \"$col\""
 done | paste -sd',')
@@ -484,39 +551,71 @@ MAX_SELECT=$(echo "$COLUMNS" | while read col; do
     echo "MAX(\"$col\") as \"$col\""
 done | paste -sd',')
 
-# Create tables and compute in single queries
+# SQLite caps a result row at 2000 columns; fusing MIN and MAX doubles the width
+if [ $((2 * NUM_COLS)) -le 2000 ]; then
+    # Compute minima and maxima together in a single scan of both tables, then
+    # split the combined row into the two domain tables
+    BOUNDS_SELECT=$(echo "$COLUMNS" | while read col; do
+        echo "MIN(\"$col\") as \"min:$col\",MAX(\"$col\") as \"max:$col\""
+    done | paste -sd',')
+    MIN_LIST=$(echo "$COLUMNS" | while read col; do
+        echo "\"min:$col\""
+    done | paste -sd',')
+    MAX_LIST=$(echo "$COLUMNS" | while read col; do
+        echo "\"max:$col\""
+    done | paste -sd',')
+
+    MINIMA_SOURCE="SELECT $MIN_LIST FROM domain_bounds"
+    MAXIMA_SOURCE="SELECT $MAX_LIST FROM domain_bounds"
+    BOUNDS_SQL="CREATE TEMP TABLE domain_bounds AS
+SELECT $BOUNDS_SELECT
+FROM (
+    SELECT $COL_LIST FROM scenario_current
+    UNION ALL
+    SELECT $COL_LIST FROM scenario_reference
+);"
+else
+    # Too wide to fuse: scan once for minima and once for maxima
+    MINIMA_SOURCE="SELECT $MIN_SELECT FROM (SELECT $COL_LIST FROM scenario_current UNION ALL SELECT $COL_LIST FROM scenario_reference)"
+    MAXIMA_SOURCE="SELECT $MAX_SELECT FROM (SELECT $COL_LIST FROM scenario_current UNION ALL SELECT $COL_LIST FROM scenario_reference)"
+    BOUNDS_SQL=""
+fi
+
+# Create tables and fill them
 sqlite3 "$OUTPUT" <<SQLDOMAIN
 DROP TABLE IF EXISTS domain_minima;
 DROP TABLE IF EXISTS domain_maxima;
 CREATE TABLE domain_minima ($COL_DEFS);
 CREATE TABLE domain_maxima ($COL_DEFS);
 
--- Compute minima across both tables in one query (columns are REAL, NA already NULL)
-INSERT INTO domain_minima
-SELECT $MIN_SELECT
-FROM (
-    SELECT * FROM scenario_current
-    UNION ALL
-    SELECT * FROM scenario_reference
-);
+$BOUNDS_SQL
 
--- Compute maxima across both tables in one query (columns are REAL, NA already NULL)
-INSERT INTO domain_maxima
-SELECT $MAX_SELECT
-FROM (
-    SELECT * FROM scenario_current
-    UNION ALL
-    SELECT * FROM scenario_reference
-);
+INSERT INTO domain_minima $MINIMA_SOURCE;
+INSERT INTO domain_maxima $MAXIMA_SOURCE;
 SQLDOMAIN
 
 echo "  Created domain_minima and domain_maxima tables with $NUM_COLS columns"
 
+# Record table and index statistics (sqlite_stat1) so the query planner knows
+# how selective the catchment ID indexes are and drives the choropleth join
+# from the spatial index instead of scanning the scenario tables
+echo "Gathering query planner statistics..."
+sqlite3 "$OUTPUT" "ANALYZE;"
+
+# Reclaim the pages left free by the dropped raw tables and rebuilt scenario
+# tables so the shipped datapack is as small as possible
+echo "Compacting datapack..."
+sqlite3 "$OUTPUT" "VACUUM;"
+
+# Replace the previous datapack in one step
+mv -f "$OUTPUT" "$FINAL_OUTPUT"
+echo "$INPUT_STAMP" > "$STAMP_FILE"
+
 # Check the result
 echo ""
-echo "Created $OUTPUT"
+echo "Created $FINAL_OUTPUT"
 echo "Layers:"
-ogrinfo "$OUTPUT" 2>/dev/null | grep -E "^\d+:" || ogrinfo "$OUTPUT"
+ogrinfo "$FINAL_OUTPUT" 2>/dev/null | grep -E "^\d+:" || ogrinfo "$FINAL_OUTPUT"
 
 echo ""
 echo "Done!"
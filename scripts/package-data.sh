@@ -94,7 +94,7 @@ EOF
 # -------------------------------------------------------
 echo "==> Creating zip archive..."
 mkdir -p "$DIST_DIR"
-(cd "$WORK_DIR" && zip -r "$DIST_DIR/$PACK_NAME.zip" "$PACK_NAME")
+(cd "$WORK_DIR" && zip -r -9 "$DIST_DIR/$PACK_NAME.zip" "$PACK_NAME")
 
 echo "==> Generating checksum..."
 (cd "$DIST_DIR" && sha256sum "$PACK_NAME.zip" > "$PACK_NAME.zip.sha256")